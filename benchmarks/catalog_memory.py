@@ -0,0 +1,72 @@
+# benchmarks/catalog_memory.py — /api/stock: bellek içi katalog ile istek başına SQL yolunun karşılaştırması
+# Kullanım:
+#   python benchmarks/catalog_memory.py                       (100k ürün)
+#   python benchmarks/catalog_memory.py --products 200000 --repeat 10 --out /tmp/katalog.json
+# Ölçülenler (uygulama süreç içinde yüklenir, önbellek atlanır; _render_public_stock doğrudan çağrılır):
+#   - kalıcı bellek: kurulu kataloğun tracemalloc farkı, yayındaki ürün başına bayt
+#   - senaryo başına çağrı süresi (p50/max ms) ve çağrı sırasında ayrılan tepe geçici bellek (MB), iki yol için
+
+import argparse, json, os, sys, tempfile, time, tracemalloc
+
+from common import ROOT, load_app, pct
+from datagen import seed_catalog
+
+def scenarios(Q):
+    return {
+        "full": (Q(), False, False),
+        "search": (Q(search="Lavabo"), False, False),
+        "page_sorted_facets": (Q(sort="price", stock="in", limit=50), False, True),
+        "campaigns_price": (Q(campaigns=("Batarya", "Fırsat Akrilik"), min_price=1000, max_price=5000), False, True),
+        "fuzzy": (Q(search="duralfe 60cm"), True, False),
+    }
+
+def measure(mod, memory, args, Q) -> dict:
+    mod.CATALOG_MEMORY = memory
+    out = {}
+    for name, (f, fuzzy, facets) in scenarios(Q).items():
+        mod._render_public_stock(f, fuzzy, facets)   # ısınma (indeks/katalog kurulumu ölçüme girmez)
+        times = []
+        for _ in range(args.repeat):
+            t0 = time.perf_counter(); body = mod._render_public_stock(f, fuzzy, facets)
+            times.append((time.perf_counter() - t0) * 1000)
+        tracemalloc.start()
+        mod._render_public_stock(f, fuzzy, facets)
+        peak = tracemalloc.get_traced_memory()[1]; tracemalloc.stop()
+        out[name] = {"p50_ms": round(pct(times, 50), 2), "max_ms": round(max(times), 2),
+                     "peak_alloc_mb": round(peak / 1e6, 2), "bytes": len(body)}
+    return out
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--products", type=int, default=100000)
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--app-dir", default=ROOT)
+    ap.add_argument("--out", default="")
+    args = ap.parse_args()
+
+    work = tempfile.mkdtemp(prefix="stok-bench-"); os.chdir(work)
+    os.environ.update(DB_PATH=os.path.join(work, "stock.db"), CATALOG_MEMORY="1")
+    mod = load_app(args.app_dir)
+    mod.init_db(); seed_catalog(os.environ["DB_PATH"], args.products)
+    mod.init_db(); mod.versions.expire()   # türetilmiş sütun/tablo doldurma + planlayıcı istatistiği
+
+    tracemalloc.start()   # kurulum süresi tracemalloc altında ölçülür, gerçekte daha kısadır
+    t0 = time.perf_counter(); mod.memory_catalog.refresh(); build_s = time.perf_counter() - t0
+    retained = tracemalloc.get_traced_memory()[0]; tracemalloc.stop()
+    active = len(mod.memory_catalog.slot)
+
+    report = {"products": args.products, "active": active,
+              "catalog": {"build_s": round(build_s, 2), "retained_mb": round(retained / 1e6, 1),
+                          "bytes_per_product": round(retained / max(active, 1))},
+              "sql": measure(mod, False, args, mod.StockQuery), "memory": measure(mod, True, args, mod.StockQuery)}
+    for name in report["sql"]:
+        a, b = report["sql"][name], report["memory"][name]
+        print(f"{name:20} sql p50 {a['p50_ms']:8.1f}ms tepe {a['peak_alloc_mb']:6.1f}MB   "
+              f"bellek p50 {b['p50_ms']:7.1f}ms tepe {b['peak_alloc_mb']:6.1f}MB", file=sys.stderr)
+    print(f"katalog: {report['catalog']['retained_mb']} MB, ürün başına {report['catalog']['bytes_per_product']} B", file=sys.stderr)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f: json.dump(report, f, ensure_ascii=False, indent=2)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# benchmarks/common.py — benchmark betiklerinin ortak yardımcıları
+# (betikler `python benchmarks/<ad>.py` olarak çalıştırılır; bu dosya aynı dizinden içe aktarılır)
+
+import importlib.util, os, resource, socket, subprocess, sys, time
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# benchmark sunucusunda hız sınırı / kabul tavanı ölçümü bozmasın: tüm istekler tek IP'den gelir
+BENCH_ENV = {"RATE_LIMITS": "", "PUBLIC_MAX_INFLIGHT": "100000", "KDF_MAX_PENDING": "1000"}
+
+def free_port() -> int:
+    s = socket.socket(); s.bind(("127.0.0.1", 0)); port = s.getsockname()[1]; s.close(); return port
+
+def pct(values, p):
+    if not values: return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))]
+
+def summarize(latencies_ms, wall_s, errors=0) -> dict:
+    n = len(latencies_ms)
+    return {"requests": n, "errors": errors, "wall_s": round(wall_s, 3),
+            "throughput_rps": round(n / wall_s, 1) if wall_s > 0 else 0.0,
+            "p50_ms": round(pct(latencies_ms, 50), 2), "p95_ms": round(pct(latencies_ms, 95), 2),
+            "p99_ms": round(pct(latencies_ms, 99), 2), "max_ms": round(max(latencies_ms, default=0), 2)}
+
+def self_peak_rss_mb() -> float:
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)   # Linux: KB
+
+def proc_peak_rss_mb(pid: int):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"): return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        return None
+    return None
+
+def load_app(app_dir: str = ROOT):
+    # stok-app.py tire içerdiği için importlib ile yüklenir; DB_PATH vb. önceden ayarlanmış olmalı
+    spec = importlib.util.spec_from_file_location("stok_app_bench", os.path.join(app_dir, "stok-app.py"))
+    mod = importlib.util.module_from_spec(spec); sys.modules[spec.name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+class Server:
+    # geçici bir uvicorn süreci; çalışma dizini `work`, veritabanı `db_path`
+    def __init__(self, work: str, db_path: str, app_dir: str = ROOT, workers: int = 1):
+        self.port = free_port(); self.url = f"http://127.0.0.1:{self.port}"
+        env = dict(os.environ, DB_PATH=db_path, **BENCH_ENV)
+        cmd = [sys.executable, "-m", "uvicorn", "--app-dir", app_dir, "stok-app:app",
+               "--port", str(self.port), "--log-level", "warning"]
+        if workers > 1: cmd += ["--workers", str(workers)]
+        self.proc = subprocess.Popen(cmd, cwd=work, env=env)
+
+    def wait(self, timeout: float = 30):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                if httpx.get(self.url + "/health").status_code == 200: return self
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.1)
+        self.stop(); raise SystemExit("sunucu başlamadı")
+
+    def peak_rss_mb(self):
+        return proc_peak_rss_mb(self.proc.pid)
+
+    def stop(self):
+        self.proc.terminate(); self.proc.wait()
@@ -0,0 +1,97 @@
+# benchmarks/datagen.py — sentetik katalog, görsel ve Excel üretimi
+# Kullanım (tek başına):
+#   python benchmarks/datagen.py --db /tmp/stock.db --products 10000 --images 200 --xlsx /tmp/stok.xlsx
+# Veritabanı şeması uygulamanın açılışında oluşturulur; bu betik yalnızca satır ekler.
+
+import argparse, os, random, sqlite3, struct, zlib
+from openpyxl import Workbook
+
+SERIES = ["DuraLife", "Nova", "Ege", "Marmara", "Kapadokya", "Efes", "Truva", "Lale", "Çınar", "Göknar", "Yıldız", "Şelale"]
+KINDS = ["Lavabo", "Klozet", "Lavabo Bataryası", "Banyo Bataryası", "Duş Seti", "Küvet", "Banyo Dolabı",
+         "Ayna Dolabı", "Ankastre Rezervuar", "Evye", "Eviye Bataryası", "Duşakabin"]
+SIZES = ["40cm", "45cm", "50cm", "60cm", "65cm", "80cm", "100cm", "120cm", "170x75", "90x90"]
+FINISHES = ["Beyaz", "Mat Beyaz", "Mat Siyah", "Krom", "Antrasit", "Meşe", "Ceviz", "Gri", "Bronz", "Fırçalanmış Çelik"]
+FEATURES = ["Kolay temizlenir sır", "Yavaş kapanan kapak", "Seramik kartuş", "Nem dayanımlı gövde",
+            "Tezgâh üstü montaj", "Asma montaj", "Kireç önleyici başlık", "5 yıl garanti", "Soft-close çekmece"]
+PRODUCT_CATEGORIES = ["Vitrifiye", "Mobilya", "Lavabo Bataryası", "Banyo Bataryası", "Küvet"]
+CAMPAIGN_CATEGORIES = ["DuraLife Collection", "DuraLife Mobilya", "Batarya", "Fırsat Akrilik"]
+
+def product_name(i: int, rnd: random.Random) -> str:
+    return f"{rnd.choice(SERIES)} {rnd.choice(KINDS)} {rnd.choice(SIZES)} {rnd.choice(FINISHES)} {i:06d}"
+
+def campaign_csv(rnd: random.Random) -> str:
+    k = rnd.choice([0, 0, 1, 1, 2])
+    cats = rnd.sample(CAMPAIGN_CATEGORIES, k)
+    return "," + ",".join(cats) + "," if cats else ""
+
+def tiny_png(seed: int) -> bytes:
+    # PIL gerektirmeyen 8x8 tek renk PNG
+    r, g, b = (seed * 67) % 256, (seed * 131) % 256, (seed * 29) % 256
+    raw = b"".join(b"\x00" + bytes((r, g, b)) * 8 for _ in range(8))
+    def chunk(tag, data): return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data) & 0xffffffff)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", 8, 8, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b""))
+
+def write_images(upload_dir: str, n: int) -> list:
+    os.makedirs(upload_dir, exist_ok=True)
+    paths = []
+    for i in range(n):
+        fname = f"bench_{i:05d}.png"
+        with open(os.path.join(upload_dir, fname), "wb") as f: f.write(tiny_png(i))
+        paths.append(f"/static/uploads/{fname}")
+    return paths
+
+def seed_catalog(db_path: str, n: int, images=(), seed: int = 42, location_code: str = "MERKEZ") -> list:
+    rnd = random.Random(seed)
+    con = sqlite3.connect(db_path)
+    loc = con.execute("SELECT id FROM location WHERE code=?", (location_code,)).fetchone()[0]
+    start = (con.execute("SELECT COALESCE(MAX(id),0) FROM product").fetchone()[0] or 0) + 1
+    names, rows = [], []
+    for i in range(start, start + n):
+        name = product_name(i, rnd); names.append(name)
+        list_price = round(rnd.uniform(500, 40000), -1)
+        rows.append((i, name, f"{rnd.choice(FEATURES)}. {rnd.choice(FEATURES)}.",
+                     rnd.choice(images) if images and rnd.random() < 0.7 else "",
+                     list_price, round(list_price * rnd.uniform(0.6, 0.95), -1),
+                     rnd.choice(["0", "150", "250", "Ücretsiz", "450"]), round(rnd.uniform(0, 500), -1),
+                     campaign_csv(rnd), rnd.choice(PRODUCT_CATEGORIES), 1 if rnd.random() < 0.9 else 0))
+    con.executemany("""INSERT INTO product(id,name,description,image_path,list_price,sale_price,cargo_fee,durapay,
+                       campaign_categories,product_category,is_active,created_at) VALUES(?,?,?,?,?,?,?,?,?,?,?,datetime('now'))""", rows)
+    con.executemany("INSERT INTO stock_snapshot(product_id,location_id,onhand,updated_at) VALUES(?,?,?,datetime('now'))",
+                    [(r[0], loc, rnd.choice([0, 0, 1, 2, 3, 5, 8, 12, 40])) for r in rows])
+    # uygulamanın yazma yollarının türettiği alanlar: sayısal kargo ücreti ve kampanya süzgeç tablosu
+    con.executemany("UPDATE product SET cargo_fee_num=? WHERE id=?",
+                    [(0.0 if r[6] == "Ücretsiz" else float(r[6]), r[0]) for r in rows])
+    con.executemany("INSERT INTO product_campaign(product_id,category) VALUES(?,?)",
+                    [(r[0], c) for r in rows for c in r[8].split(",") if c])
+    con.execute("INSERT INTO cache_version(name,version) VALUES('catalog',1) ON CONFLICT(name) DO UPDATE SET version=cache_version.version+1")
+    con.commit(); con.close()
+    return names
+
+def write_excel(path: str, names: list, new_rows: int = 0, seed: int = 7) -> int:
+    # ERP dışa aktarımına benzer: Item / Available Qnt, ara sıra ondalık virgül ve boş hücre
+    rnd = random.Random(seed)
+    wb = Workbook(write_only=True); ws = wb.create_sheet("Stok")
+    ws.append(["Item", "Description", "Available Qnt", "Warehouse"])
+    for name in names:
+        qty = rnd.choice([0, 1, 2, 5, 10, "3,0", "12,5", None])
+        ws.append([name, "", qty, "MERKEZ"])
+    for i in range(new_rows):
+        ws.append([f"YENİ {rnd.choice(KINDS)} {i:05d}", "", rnd.randint(0, 20), "MERKEZ"])
+    wb.save(path)
+    return len(names) + new_rows
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db", required=True)
+    ap.add_argument("--products", type=int, default=1000)
+    ap.add_argument("--images", type=int, default=0)
+    ap.add_argument("--upload-dir", default="static/uploads")
+    ap.add_argument("--xlsx", default="")
+    args = ap.parse_args()
+    images = write_images(args.upload_dir, args.images) if args.images else []
+    names = seed_catalog(args.db, args.products, images)
+    if args.xlsx: write_excel(args.xlsx, names, new_rows=len(names) // 20)
+
+if __name__ == "__main__":
+    main()
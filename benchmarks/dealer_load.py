@@ -0,0 +1,66 @@
+# benchmarks/dealer_load.py — bayi uç noktaları için eşzamanlı yük testi
+# Kullanım:
+#   python benchmarks/dealer_load.py --products 2000 --dealers 200 --rounds 5
+#   python benchmarks/dealer_load.py --url http://127.0.0.1:8000      (çalışan sunucuya karşı)
+#   python benchmarks/dealer_load.py --app-dir /tmp/eski-surum           (önce/sonra karşılaştırması için başka bir çalışma kopyası)
+# Her sanal bayi bir sayfa görüntülemesini taklit eder: GET /dealer ardından GET /api/stock.
+# Sonuç: uç nokta başına p50/p95/p99/max gecikme (ms) ve toplam istek/sn, JSON olarak.
+
+import argparse, asyncio, json, os, tempfile, time
+import httpx
+
+from common import ROOT, Server, pct
+from datagen import seed_catalog
+
+async def dealer(client, rounds, lat):
+    for _ in range(rounds):
+        for path in ("/dealer", "/api/stock"):
+            t0 = time.perf_counter()
+            try:
+                r = await client.get(path)
+            except httpx.HTTPError as e:
+                lat["errors"].append(type(e).__name__); continue
+            lat[path].append((time.perf_counter() - t0) * 1000)
+            if r.status_code >= 400: lat["errors"].append(r.status_code)
+
+async def run(url, dealers, rounds):
+    lat = {"/dealer": [], "/api/stock": [], "errors": []}
+    limits = httpx.Limits(max_connections=dealers, max_keepalive_connections=dealers)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=120) as client:
+        await client.get("/api/stock")   # ısınma
+        t0 = time.perf_counter()
+        await asyncio.gather(*(dealer(client, rounds, lat) for _ in range(dealers)))
+        wall = time.perf_counter() - t0
+    out = {"dealers": dealers, "rounds": rounds, "wall_s": round(wall, 3),
+           "requests_per_s": round(dealers * rounds * 2 / wall, 1), "errors": len(lat["errors"])}
+    for path in ("/dealer", "/api/stock"):
+        v = lat[path]
+        out[path] = {"p50_ms": round(pct(v, 50), 1), "p95_ms": round(pct(v, 95), 1),
+                     "p99_ms": round(pct(v, 99), 1), "max_ms": round(max(v, default=0), 1)}
+    return out
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--url", default="", help="çalışan sunucu; verilmezse geçici bir uvicorn başlatılır")
+    ap.add_argument("--app-dir", default=ROOT, help="stok-app.py dosyasının bulunduğu dizin")
+    ap.add_argument("--products", type=int, default=2000)
+    ap.add_argument("--dealers", type=int, default=200)
+    ap.add_argument("--rounds", type=int, default=5)
+    args = ap.parse_args()
+
+    if args.url:
+        print(json.dumps(asyncio.run(run(args.url, args.dealers, args.rounds)), indent=2)); return
+
+    work = tempfile.mkdtemp(prefix="stok-bench-")
+    db_path = os.path.join(work, "stock.db")
+    server = Server(work, db_path, args.app_dir).wait()
+    try:
+        seed_catalog(db_path, args.products)
+        result = asyncio.run(run(server.url, args.dealers, args.rounds))
+        result["products"] = args.products
+        print(json.dumps(result, indent=2))
+    finally:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# benchmarks/run.py — katalog ve içe aktarma yolları için tekrarlanabilir benchmark takımı
+# Kullanım:
+#   python benchmarks/run.py                                  (1k ürün, ASGI + uvicorn)
+#   python benchmarks/run.py --sizes 1000,10000,200000 --modes uvicorn --requests 200 --concurrency 20
+#   python benchmarks/run.py --out benchmarks/results/ana-dal.json
+# Her (mod, boyut) ayrı bir alt süreçte koşar; böylece tepe RSS birbirini etkilemez.
+#   asgi    → uygulama süreç içinde httpx.ASGITransport ile sürülür (ağ yığını yok)
+#   uvicorn → gerçek bir uvicorn süreci; RSS sunucu sürecinden okunur
+# Senaryolar: /api/stock (tam liste, aramalı, bulanık aramalı, süzgeç + sıralama + yüz sayımlı), /dealer, /admin/products, /admin/products/upload-excel.
+# Çıktı: senaryo başına p50/p95/p99/max (ms), istek/sn, hata sayısı ve tepe RSS (MB), JSON olarak.
+
+import argparse, asyncio, json, os, platform, random, subprocess, sys, tempfile, time
+from datetime import datetime
+import httpx
+
+from common import ROOT, BENCH_ENV, Server, load_app, self_peak_rss_mb, summarize
+from datagen import PRODUCT_CATEGORIES, SERIES, SIZES, seed_catalog, write_excel, write_images
+
+async def drive(client, method, paths, n, concurrency, **kw):
+    lat, errors = [], 0
+    todo = iter(range(n))
+    async def worker():
+        nonlocal errors
+        for i in todo:
+            t0 = time.perf_counter()
+            try:
+                r = await client.request(method, paths(i), **kw)
+                if r.status_code >= 400: errors += 1
+            except httpx.HTTPError:
+                errors += 1; continue
+            lat.append((time.perf_counter() - t0) * 1000)
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(lat, time.perf_counter() - t0, errors)
+
+async def import_runs(client, n, files):
+    # yükleme iş kuyruğuna alınır; süre, iş bitene kadar (yükleme + ayrıştırma + içe aktarma) ölçülür
+    lat, errors = [], 0
+    t_all = time.perf_counter()
+    for _ in range(n):
+        t0 = time.perf_counter()
+        try:
+            r = await client.post("/admin/products/upload-excel", files=files, follow_redirects=False)
+            jid = r.headers.get("location", "").partition("job=")[2]
+            if r.status_code >= 400 or not jid: errors += 1; continue
+            while (job := (await client.get(f"/admin/jobs/{jid}")).json())["status"] in ("pending", "running"):
+                await asyncio.sleep(0.02)
+            if job["status"] != "done": errors += 1; continue
+        except httpx.HTTPError:
+            errors += 1; continue
+        lat.append((time.perf_counter() - t0) * 1000)
+    return summarize(lat, time.perf_counter() - t_all, errors)
+
+async def scenarios(client, args, xlsx_path, xlsx_rows):
+    rnd = random.Random(1)
+    searches = [f"{s} {z}" for s in SERIES for z in SIZES]
+    out = {}
+    r = await client.post("/login", data={"username": "admin", "password": "admin123"})
+    if r.status_code >= 400: raise SystemExit("benchmark girişi başarısız")
+    n, c = args.requests, args.concurrency
+    out["api_stock"] = await drive(client, "GET", lambda i: "/api/stock", n, c)
+    out["api_stock_search"] = await drive(client, "GET", lambda i: "/api/stock?search=" + rnd.choice(searches), n, c)
+    typos = [q[:3] + q[4:] for q in searches]   # dördüncü harfi eksik sorgular
+    out["api_stock_fuzzy"] = await drive(client, "GET", lambda i: "/api/stock?fuzzy=1&search=" + rnd.choice(typos), n, c)
+    filters = [f"sort={o}&stock=in&limit=50&facets=1&product_category={k}" for o in ("price", "-price", "new") for k in PRODUCT_CATEGORIES]
+    out["api_stock_filtered"] = await drive(client, "GET", lambda i: "/api/stock?" + rnd.choice(filters), n, c)
+    out["dealer"] = await drive(client, "GET", lambda i: "/dealer", n, c)
+    out["admin_products"] = await drive(client, "GET", lambda i: "/admin/products", max(3, n // 10), min(c, 4))
+    with open(xlsx_path, "rb") as f: body = f.read()
+    files = {"xls": ("stok.xlsx", body, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")}
+    res = await import_runs(client, args.imports, files)
+    res["rows"] = xlsx_rows
+    res["rows_per_s"] = round(xlsx_rows / (res["p50_ms"] / 1000), 1) if res["p50_ms"] else 0.0
+    out["upload_excel"] = res
+    return out
+
+def prepare(work, db_path, size, args):
+    images = write_images(os.path.join(work, "static", "uploads"), args.images)
+    names = seed_catalog(db_path, size, images)
+    xlsx = os.path.join(work, "stok.xlsx")
+    rows = write_excel(xlsx, names[:args.excel_rows], new_rows=args.excel_rows // 20)
+    return xlsx, rows
+
+def child(mode, size, args) -> dict:
+    work = tempfile.mkdtemp(prefix="stok-bench-")
+    db_path = os.path.join(work, "stock.db")
+    t_setup = time.perf_counter()
+    if mode == "asgi":
+        os.chdir(work); os.environ.update(DB_PATH=db_path, **BENCH_ENV)
+        mod = load_app(args.app_dir)
+        async def go():
+            await mod.app.router.startup()
+            xlsx, rows = prepare(work, db_path, size, args)
+            setup_s = time.perf_counter() - t_setup
+            transport = httpx.ASGITransport(app=mod.app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+                res = await scenarios(client, args, xlsx, rows)
+            await mod.app.router.shutdown()
+            return res, setup_s
+        res, setup_s = asyncio.run(go())
+        rss = self_peak_rss_mb()
+    else:
+        server = Server(work, db_path, args.app_dir).wait()
+        try:
+            xlsx, rows = prepare(work, db_path, size, args)
+            setup_s = time.perf_counter() - t_setup
+            async def go():
+                limits = httpx.Limits(max_connections=args.concurrency)
+                async with httpx.AsyncClient(base_url=server.url, limits=limits, timeout=600) as client:
+                    return await scenarios(client, args, xlsx, rows)
+            res = asyncio.run(go())
+            rss = server.peak_rss_mb()
+        finally:
+            server.stop()
+    return {"mode": mode, "products": size, "setup_s": round(setup_s, 2), "peak_rss_mb": rss, "scenarios": res}
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="1000", help="virgülle ayrılmış ürün sayıları (1k–200k)")
+    ap.add_argument("--modes", default="asgi,uvicorn")
+    ap.add_argument("--requests", type=int, default=100, help="okuma senaryosu başına istek")
+    ap.add_argument("--concurrency", type=int, default=10)
+    ap.add_argument("--imports", type=int, default=3, help="Excel içe aktarma tekrarı")
+    ap.add_argument("--excel-rows", type=int, default=5000)
+    ap.add_argument("--images", type=int, default=50)
+    ap.add_argument("--app-dir", default=ROOT)
+    ap.add_argument("--out", default="", help="JSON dosyası; verilmezse benchmarks/results/<zaman>.json")
+    ap.add_argument("--child", default="", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        mode, size = args.child.split(":")
+        print(json.dumps(child(mode, int(size), args))); return
+
+    runs = []
+    for size in [int(s) for s in args.sizes.split(",") if s.strip()]:
+        for mode in [m.strip() for m in args.modes.split(",") if m.strip()]:
+            cmd = [sys.executable, os.path.abspath(__file__), "--child", f"{mode}:{size}",
+                   "--requests", str(args.requests), "--concurrency", str(args.concurrency),
+                   "--imports", str(args.imports), "--excel-rows", str(args.excel_rows),
+                   "--images", str(args.images), "--app-dir", args.app_dir]
+            proc = subprocess.run(cmd, capture_output=True, text=True)
+            if proc.returncode:
+                sys.stderr.write(proc.stderr); raise SystemExit(f"{mode}:{size} başarısız")
+            out = proc.stdout
+            run = json.loads(out.strip().splitlines()[-1]); runs.append(run)
+            print(f"{mode:8} {size:>7} ürün  " + "  ".join(
+                f"{k}: p50 {v['p50_ms']}ms p99 {v['p99_ms']}ms" for k, v in run["scenarios"].items()), file=sys.stderr)
+    try:
+        rev = subprocess.run(["git", "-C", args.app_dir, "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip()
+    except OSError:
+        rev = ""
+    report = {"meta": {"timestamp": datetime.now().isoformat(timespec="seconds"), "git": rev,
+                       "python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count(),
+                       "requests": args.requests, "concurrency": args.concurrency}, "runs": runs}
+    path = args.out or os.path.join(ROOT, "benchmarks", "results", datetime.now().strftime("%Y%m%d-%H%M%S") + ".json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f: json.dump(report, f, ensure_ascii=False, indent=2)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
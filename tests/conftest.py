@@ -0,0 +1,55 @@
+# tests/conftest.py — depo (store) testleri SQLite ve Postgres üzerinde aynı gövdeyle koşar
+# Kullanım:
+#   python -m pytest -q                                                        (yalnızca SQLite)
+#   TEST_DATABASE_URL=postgresql://postgres@127.0.0.1:5432/stok_test python -m pytest -q
+# Postgres testleri TEST_DATABASE_URL yoksa, psycopg kurulu değilse ya da sunucuya bağlanılamazsa atlanır.
+# DİKKAT: TEST_DATABASE_URL'deki veritabanının public şeması her testte silinip yeniden kurulur.
+
+import importlib.util, os, sys, tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "")
+
+def _load_app():
+    # stok-app.py tire içerdiği için importlib ile yüklenir; yükleme sırasında açılan klasörler geçici dizinde kalır
+    work = tempfile.mkdtemp(prefix="stok-test-"); os.chdir(work)
+    os.environ.update(DB_PATH=os.path.join(work, "boot.db"), DB_BACKEND="sqlite")
+    spec = importlib.util.spec_from_file_location("stokapp", os.path.join(ROOT, "stok-app.py"))
+    mod = importlib.util.module_from_spec(spec); sys.modules["stokapp"] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+@pytest.fixture(scope="session")
+def app():
+    return _load_app()
+
+def _postgres_url() -> str:
+    if not TEST_DATABASE_URL: pytest.skip("TEST_DATABASE_URL tanımlı değil")
+    try:
+        import psycopg
+    except ImportError:
+        pytest.skip("psycopg kurulu değil")
+    try:
+        with psycopg.connect(TEST_DATABASE_URL, autocommit=True, connect_timeout=3) as con:
+            con.execute("DROP SCHEMA IF EXISTS public CASCADE")
+            con.execute("CREATE SCHEMA public")
+    except psycopg.OperationalError as e:
+        pytest.skip(f"Postgres'e bağlanılamadı: {e}")
+    return TEST_DATABASE_URL
+
+@pytest.fixture(params=["sqlite", "postgres"])
+def store(request, app, tmp_path, monkeypatch):
+    # modüldeki `store` da değiştirilir: sürüm tablosu, önbellekler ve yardımcı fonksiyonlar aynı depoyu görür
+    if request.param == "sqlite":
+        monkeypatch.setattr(app, "DB_PATH", str(tmp_path / "stock.db"))
+        s = app.SqliteStore()
+    else:
+        s = app.PostgresStore(_postgres_url())
+    monkeypatch.setattr(app, "store", s)
+    s.init_schema()
+    app.versions.expire()
+    yield s
+    if request.param == "postgres": s.pool.close()
+    app.versions.expire()
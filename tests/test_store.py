@@ -0,0 +1,195 @@
+# tests/test_store.py — veri erişim katmanı: ürünler, stok içe aktarma, kampanyalar, kullanıcılar
+# Her test conftest.py'deki `store` ile iki kez koşar (sqlite / postgres).
+
+LOC = "MAIN"
+
+def product(app, **kw):
+    fields = {"name": "DuraLife 60cm", "description": "Lavabo", "image_path": "", "list_price": 100.0,
+              "sale_price": 90.0, "cargo_fee": "150", "durapay": 10.0, "campaign_categories": ",Batarya,",
+              "product_category": app.PRODUCT_CATEGORIES[0], "is_active": 1}
+    fields.update(kw)
+    return fields
+
+# ---------- ürünler ----------
+def test_create_get_update_product(app, store):
+    pid = store.create_product(product(app))
+    row = store.get_product(pid)
+    assert row["name"] == "DuraLife 60cm" and row["sale_price"] == 90.0 and row["cargo_fee_num"] == 150.0
+    assert store.name_taken("DuraLife 60cm") and not store.name_taken("DuraLife 60cm", exclude_id=pid)
+    rev = row["rev"]
+    store.update_product(pid, product(app, sale_price=80.0, cargo_fee="Ücretsiz", campaign_categories=""))
+    row = store.get_product(pid)
+    assert row["sale_price"] == 80.0 and row["cargo_fee_num"] == 0.0 and row["rev"] > rev
+    assert store.get_product(pid + 1000) is None
+
+def test_cargo_fee_value(app):
+    cases = {"150": 150.0, "1.250,50 TL": 1250.5, "1.250 TL": 1250.0, "2.500.000": 2500000.0,
+             "12.5": 12.5, "1.25": 1.25, "Ücretsiz": 0.0, "": 0.0, "sorunuz": None}
+    assert {t: app.cargo_fee_value(t) for t in cases} == cases
+
+def test_cargo_fee_backfill_runs_once(app, store):
+    a = store.create_product(product(app, name="A"))
+    b = store.create_product(product(app, name="B"))
+    with store.tx() as con:   # sütun sonradan eklenmiş gibi: yazımda hesaplanmamış satırlar
+        con.execute(store.sql("UPDATE product SET cargo_fee=?, cargo_fee_num=NULL, cargo_fee_parsed=0 WHERE id=?"), ("1.250 TL", a))
+        con.execute(store.sql("UPDATE product SET cargo_fee=?, cargo_fee_num=NULL, cargo_fee_parsed=0 WHERE id=?"), ("sorunuz", b))
+    store.init_schema()
+    assert store.get_product(a)["cargo_fee_num"] == 1250.0
+    row = store.get_product(b)
+    assert row["cargo_fee_num"] is None and row["cargo_fee_parsed"] == 1   # çözülemeyen metin bir daha denenmez
+
+def test_public_stock_filters_sorts_and_facets(app, store):
+    a = store.create_product(product(app, name="Alpha Lavabo", sale_price=300.0))
+    b = store.create_product(product(app, name="beta lavabo", sale_price=100.0, campaign_categories=""))
+    store.create_product(product(app, name="Taslak", is_active=0))
+    store.set_snapshot(a, LOC, 3); store.set_snapshot(b, LOC, 0)
+    Q = app.StockQuery
+    names = lambda f: [r["name"] for r in store.list_public_stock(LOC, f)]
+    assert names(Q()) == ["Alpha Lavabo", "beta lavabo"]                       # taslak yayında değil
+    assert names(Q(search="LAVABO")) == ["Alpha Lavabo", "beta lavabo"]        # büyük/küçük harf duyarsız
+    assert names(Q(campaigns=("Batarya",))) == ["Alpha Lavabo"]
+    assert names(Q(sort="price")) == ["beta lavabo", "Alpha Lavabo"]
+    assert names(Q(min_price=200)) == ["Alpha Lavabo"]
+    assert names(Q(stock="in")) == ["Alpha Lavabo"] and names(Q(stock="out")) == ["beta lavabo"]
+    assert names(Q(stock="low")) == ["Alpha Lavabo"]                           # 0 < 3 <= LOW_STOCK_QTY
+    assert names(Q(limit=1, offset=1)) == ["beta lavabo"]
+    agg = store.public_stock_facets(LOC, Q())
+    assert agg["total"] == 2 and agg["price"] == {"min": 100.0, "max": 300.0}
+
+def test_public_changes_since_revision(app, store):
+    a = store.create_product(product(app, name="A"))
+    since = store.get_product(a)["rev"]
+    b = store.create_product(product(app, name="B"))
+    store.update_product(a, product(app, name="A", is_active=0))
+    changed = {r["id"]: r["is_active"] for r in store.list_public_changes(LOC, since)}
+    assert changed == {a: 0, b: 1}
+
+def test_fuzzy_search_ranks_by_word_trigram_overlap(app, store):
+    ids = {n: store.create_product(product(app, name=n)) for n in
+           ("DuraLife 60cm", "DuraLife 62cm", "DuraLife 62cm Lavabo Seti", "Nova Klozet 62cm")}
+    index = app.TrigramIndex()
+    assert index.search("duralif 62")[:2] == [ids["DuraLife 62cm"], ids["DuraLife 62cm Lavabo Seti"]]
+    assert index.search("DURALIFE62CM")[0] == ids["DuraLife 62cm"]
+    assert index.search("nova kozet")[0] == ids["Nova Klozet 62cm"]
+    assert index.search("xyz") == []
+
+# ---------- stok içe aktarma ----------
+def test_import_stock_updates_and_creates_drafts(app, store):
+    pid = store.create_product(product(app))
+    store.set_snapshot(pid, LOC, 7)
+    up_ok, up_new, alerts = store.import_stock([("DuraLife 60cm", 12.0), ("Yeni Ürün", 3.5)], LOC)
+    assert (up_ok, up_new, alerts) == (1, 1, 0)
+    assert store.get_onhand(pid, LOC) == 12.0
+    new = store.find_product_id("Yeni Ürün")
+    assert store.get_product(new)["is_active"] == 0 and store.get_onhand(new, LOC) == 3.5
+
+def test_import_stock_skips_unchanged_rows(app, store):
+    pid = store.create_product(product(app))
+    store.import_stock([("DuraLife 60cm", 5.0)], LOC)
+    rev = store.get_product(pid)["rev"]
+    assert store.import_stock([("DuraLife 60cm", 5.0)], LOC) == (1, 0, 0)
+    assert store.get_product(pid)["rev"] == rev   # bayi deltasına girmez
+
+def test_import_stock_commits_in_chunks(app, store, monkeypatch):
+    monkeypatch.setattr(app, "IMPORT_CHUNK_ROWS", 2)
+    seen = []
+    assert store.import_stock([(f"Ü{i}", float(i)) for i in range(5)], LOC, seen.append) == (0, 5, 0)
+    assert seen == [0.4, 0.8, 1.0]   # her dilim commit'inden sonra
+    assert store.get_onhand(store.find_product_id("Ü4"), LOC) == 4.0
+
+def test_stock_alerts_on_threshold_crossing(app, store):
+    pid = store.create_product(product(app))
+    store.set_threshold(10, category=app.PRODUCT_CATEGORIES[0])
+    store.set_snapshot(pid, LOC, 50)
+    assert store.set_snapshot(pid, LOC, 8) == 1      # 50 → 8: eşiğin altına indi
+    assert store.set_snapshot(pid, LOC, 6) == 0      # zaten altında
+    assert store.import_stock([("DuraLife 60cm", 0.0)], LOC)[2] == 1   # tükendi
+    store.set_snapshot(pid, LOC, 50)
+    assert store.set_snapshot(pid, LOC, 8) == 0      # aynı gün aynı tür: tekrar üretilmez
+    assert [a["kind"] for a in store.list_alerts()] == ["out", "low"]
+
+def test_watch_import_state_ignores_failed_rows(app, store):
+    rec = lambda sha, status: store.add_import_history({"source": "watch", "path": "/w/a.xlsx", "sha256": sha, "status": status})
+    assert store.watch_import_state("/w/a.xlsx", "h1")[:2] == (None, 0)
+    rec("h1", "done"); rec("h2", "failed"); rec("h2", "failed")
+    done, fails, last = store.watch_import_state("/w/a.xlsx", "h2")
+    assert (done, fails) == ("h1", 2) and last   # başarısız deneme atlatmaz, sayılır
+    rec("h2", "done")
+    assert store.watch_import_state("/w/a.xlsx", "h2")[:2] == ("h2", 0)
+
+# ---------- bayi fiyatları ----------
+def test_tier_prices_follow_products_and_rules(app, store):
+    pid = store.create_product(product(app, sale_price=200.0, durapay=20.0))
+    tid = store.save_tier("Altın", 10)
+    assert [(r["price"], r["durapay"]) for r in store.tier_prices(tid)] == [(180.0, 18.0)]
+    store.update_product(pid, product(app, sale_price=0.0, list_price=50.0, durapay=20.0))   # satış fiyatı yok → liste fiyatı
+    assert [r["price"] for r in store.tier_prices(tid)] == [45.0]
+    store.set_tier_rule(tid, app.PRODUCT_CATEGORIES[0], None, True)
+    assert store.tier_prices(tid) == []
+    assert store.list_public_stock(LOC, app.StockQuery(tier=tid)) == []
+
+# ---------- kampanyalar ----------
+def test_campaign_popups(app, store):
+    store.add_popups(["/static/uploads/a.png", "/static/uploads/b.png"])
+    rows = store.list_active_popups()
+    assert [r["image_path"] for r in rows] == ["/static/uploads/b.png", "/static/uploads/a.png"]   # aynı sırada yeni önce
+    second, first = rows[0]["id"], rows[1]["id"]
+    store.update_popup(first, -1, "2025-01-01T00:00", "")
+    assert [r["id"] for r in store.list_active_popups()] == [first, second]
+    assert store.get_popup(first)["starts_at"] == "2025-01-01T00:00"
+    store.delete_popup(first)
+    assert store.get_popup(first) is None
+    assert store.referenced_uploads() == {"/static/uploads/b.png"}
+
+# ---------- kullanıcılar ----------
+def test_users(app, store):
+    admin = store.get_login_user("admin")
+    assert admin and app.verify_password("admin123", admin["password"])[0]
+    assert store.create_user("u1", app.hash_password("p1"))
+    assert not store.create_user("u1", app.hash_password("p2"))   # kullanıcı adı benzersiz
+    uid = store.get_login_user("u1")["id"]
+    assert store.active_users()["u1"] == uid
+    store.set_password(uid, app.hash_password("yeni"))
+    assert app.verify_password("yeni", store.get_login_user("u1")["password"])[0]
+    store.delete_user(uid)
+    assert store.get_user_by_id(uid) is None and "u1" not in store.active_users()
+
+# ---------- iş kuyruğu / denetim ----------
+def test_job_queue_claims_once(app, store):
+    jid = store.enqueue_job("x", {"a": 1}, unique=True)
+    assert store.enqueue_job("x", {"a": 2}, unique=True) == jid
+    job = store.claim_job(60)
+    assert job["id"] == jid and job["status"] == "running" and store.claim_job(60) is None
+    assert store.running_jobs(("x",)) == 1 and store.running_jobs(("y", "z")) == 0
+    store.finish_job(jid, {"ok": True})
+    assert store.get_job(jid)["status"] == "done" and store.running_jobs(("x",)) == 0
+
+def test_audit_log_filters_and_pages(app, store):
+    store.add_audit([(f"2025-01-01T00:00:{i:02d}", "admin" if i % 2 else "u1", "product_update", "product", i % 3, "{}")
+                     for i in range(10)])
+    assert len(store.list_audit(username="admin")) == 5
+    assert {r["entity_id"] for r in store.list_audit(entity="product", entity_id=1)} == {1}
+    page = store.list_audit(limit=4)
+    rest = store.list_audit(before=(page[-1]["at"], page[-1]["id"]), limit=100)
+    assert len(page) + len(rest) == 10 and page[-1]["at"] > rest[0]["at"]
+    assert len(store.list_audit(since="2025-01-01T00:00:05", until="2025-01-01T00:00:08")) == 3
+
+# ---------- yerel önbellek ----------
+def test_local_cache_is_bounded_by_bytes(app, store):
+    cache = app.LocalCache("catalog", max_entries=100, max_bytes=1000)
+    app.LocalCache.instances.remove(cache)
+    for i in range(10): cache.get(i, lambda: b"x" * 200)
+    assert cache.bytes <= 1000 and list(cache._data) == [5, 6, 7, 8, 9]   # en eskiler düşer
+    assert cache.get("big", lambda: b"x" * 300) == b"x" * 300 and "big" not in cache._data   # tavanın 1/4'ünden büyük
+    store.create_product(product(app))   # katalog sürümü değişti → boşalır
+    app.versions.expire()
+    cache.get("a", lambda: b"y")
+    assert list(cache._data) == ["a"] and cache.bytes == 1
+
+# ---------- istek sınırlama ----------
+def test_rate_limit_spec_rejects_zero_rate(app):
+    assert set(app._parse_limits("/api/stock=5:20, /dealer=2:10")) == {"/api/stock", "/dealer"}
+    for bad in ("/dealer=0:10", "/dealer=2:0"):
+        try: app._parse_limits(bad)
+        except RuntimeError as e: assert "RATE_LIMITS" in str(e)
+        else: raise AssertionError(bad)